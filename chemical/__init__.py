@@ -22,33 +22,80 @@ class it:
     """
     traits = {}
 
+    # Sorted view of `traits` used by __dir__, rebuilt lazily whenever
+    # trait() registers something new.
+    _sorted_traits = None
+
+    # No per-instance __dict__: combinator chains allocate one it per
+    # stage, so the fixed slot layout keeps them small. Trait subclasses
+    # declare their own __slots__ for any extra state.
+    __slots__ = (
+        'items', '_modified', '_bounds', '_reverse', '_exact_size',
+        '_map_fn', '_filter_fn', '_take_n', '_fuse_src'
+    )
+
     def __init__(self, items=[], reverse_seed=None, bounds=[]):
         self._modified = False
         self.items = iter(items)
+        self._map_fn = None
+        self._filter_fn = None
+        self._take_n = None
+        self._fuse_src = None
+
+        # True only when `_bounds` is known to be the true element count:
+        # sized sources, and stages that provably preserve or clamp their
+        # source's exact count (they opt in after construction). Hints such
+        # as zip's summed bounds are estimates and must leave this False.
+        self._exact_size = False
 
         if isinstance(items, it):
-            self._lower_bound, self._upper_bound = bounds or items.size_hint()
-            self.reverse = reverse_seed or items.reverse
+            self._bounds = tuple(bounds or items.size_hint())
+            if not bounds:
+                self._exact_size = items._exact_size
+            if reverse_seed is not None:
+                self._reverse = reverse_seed
+            else:
+                self._reverse = lambda: items.reverse
 
         else:
             if bounds:
-                self._lower_bound, self._upper_bound = bounds
+                self._bounds = tuple(bounds)
+            else:
+                try:
+                    self._bounds = (len(items),) * 2
+                    self._exact_size = True
+                except TypeError:
+                    self._bounds = (0, None)
+            if reverse_seed is not None:
+                self._reverse = reverse_seed
             else:
                 try:
-                    self._lower_bound = len(items)
-                    self._upper_bound = len(items)
+                    self._reverse = it(reversed(items))
                 except TypeError:
-                    self._lower_bound = 0
-                    self._upper_bound = None
-            try:
-                self.reverse = reverse_seed or it(reversed(items))
-            except TypeError:
-                self.reverse = None
+                    self._reverse = None
 
     def __copy__(self):
         from copy import copy
         return it(copy(self.items), copy(self.reverse))
 
+    @property
+    def reverse(self):
+        """
+        The reverse-order twin of this iterator.
+
+        Combinators register it as a zero-argument thunk so the reverse
+        pipeline is only ever built if `rev()` is actually called; the
+        thunk is resolved (and cached) on first access.
+        """
+        r = self._reverse
+        if callable(r) and not hasattr(r, '__next__'):
+            r = self._reverse = r()
+        return r
+
+    @reverse.setter
+    def reverse(self, value):
+        self._reverse = value
+
     def __str__(self):
         return f'<{self.__class__.__name__} object at {hex(id(self))}>'
 
@@ -79,34 +126,26 @@ class it:
         return next(self.items)
 
     def __dir__(self):
-        from itertools import chain
-        keys = set(self.__dict__.keys()) ^ {'items'}
-        return sorted(set(chain(keys, self.traits.keys())))
+        if it._sorted_traits is None:
+            it._sorted_traits = sorted(it.traits)
+        keys = set()
+        for klass in type(self).__mro__:
+            keys.update(getattr(klass, '__slots__', ()))
+        try:
+            # Subclasses defined outside this package may not use
+            # __slots__, in which case their instances have a __dict__.
+            keys.update(self.__dict__)
+        except TraitException:
+            pass
+        keys.discard('items')
+        # dir() sorts its final result itself, so the cached trait list
+        # can simply be appended rather than re-sorted per call.
+        return sorted(keys) + it._sorted_traits
 
     def __getattr__(self, name):
-        if name not in it.traits:
-            raise TraitException(
-                f'Trait or extension method "{name}" not found for {self}.'
-            )
-
-        clazz = it.traits[name]
-
-        class wrap:
-            __doc__ = clazz.__doc__
-
-            def __init__(self, items, clazz, name):
-                self.items = items
-                self.clazz = clazz
-                self.name = name
-
-            def __repr__(self):
-                hid = hex(id(self.clazz))
-                return f'<{self.__module__}.it.{self.name} at {hid}>'
-
-            def __call__(self, *args, **kwargs):
-                return self.clazz(self.items, *args, **kwargs)
-
-        return wrap(self, clazz, name)
+        raise TraitException(
+            f'Trait or extension method "{name}" not found for {self}.'
+        )
 
     def next(self):
         return next(self)
@@ -115,26 +154,37 @@ class it:
         return reversed(self)
 
     def size_hint(self):
-        return self._lower_bound, self._upper_bound
+        return self._bounds
 
 
-def trait(bind=None):
-    def inner(*args, **kwargs):
-        nonlocal bind
-        return bind(*args, **kwargs)
+def _make_trait_method(name, clazz):
+    """
+    Builds the method installed on `it` for a registered trait: a thin
+    forwarder that hands the iterator and any arguments to the trait's
+    class or function.
+    """
+    def method(self, *args, **kwargs):
+        return clazz(self, *args, **kwargs)
+
+    method.__name__ = name
+    method.__qualname__ = f'it.{name}'
+    method.__doc__ = clazz.__doc__
+    return method
 
+
+def trait(bind=None):
     def wrapper(clazz):
-        __doc__ = clazz.__doc__
         nonlocal bind
         it.traits[bind] = clazz
+        it._sorted_traits = None
+        setattr(it, bind, _make_trait_method(bind, clazz))
         return clazz
 
     if isinstance(bind, str):
         return wrapper
 
-    it.traits[bind.__name__.lower()] = bind
-    inner.__doc__ = bind.__doc__
-    return bind
+    clazz, bind = bind, bind.__name__.lower()
+    return wrapper(clazz)
 
 
 class Ordering(Enum):
@@ -1,3 +1,5 @@
+import itertools
+from collections import deque
 from . import it, trait, ChemicalException, Ordering
 
 
@@ -44,6 +46,10 @@ def collect(self, into=list):
 
     All other collections are formed by passing the iterator to the constructor.
 
+    When the iterator is a plain `it` (no trait subclass with its own
+    `__get_next__`), the underlying iterator is handed to the collection
+    constructor directly so consumption happens entirely at C level.
+
     **Examples**
 
         :::python
@@ -52,11 +58,20 @@ def collect(self, into=list):
         assert it(range(3)).collect(tuple) == (0, 1, 2)
         assert it(range(3)).collect(set) == {0, 1, 2}
         assert it('abc').collect(str) == 'abc'
+        assert it((104, 105)).collect(bytes) == b'hi'
     """
-    if into == str:
-        return ''.join(str(i) for i in self)
+    if type(self) is it:
+        self._modified = True
+        source = self.items
+    else:
+        source = self
+
+    if into is str:
+        return ''.join(map(str, source))
+    elif into is bytes:
+        return bytes(source)
     else:
-        return into(self)
+        return into(source)
 
 
 @trait
@@ -84,10 +99,15 @@ def nth(self, num):
     if num == 0:
         raise ChemicalException('nth: to take the first item, use integer 1')
 
-    for i in range(abs(num)):
-        item = next(self if num > 0 else self.reverse)
+    hi = self._bounds[1]
+    if self._exact_size and hi is not None and abs(num) > hi:
+        raise StopIteration(
+            f'nth: iterator holds at most {hi} item(s), cannot yield item {num}'
+        )
 
-    return item
+    if num > 0:
+        return next(itertools.islice(self, num - 1, None))
+    return next(itertools.islice(self.reverse, -num - 1, None))
 
 
 @trait
@@ -112,10 +132,15 @@ def count(self):
     """
     # NOTE(pebaz): `it.__len__` can never exist because list(), etc. would try
     # to use it, which would consume it.
-    index = 0
-    for _ in self:
-        index += 1
-    return index
+    lo, hi = self._bounds
+    if self._exact_size and hi is not None and lo == hi and not self._modified:
+        # The length is known statically; skip iterating entirely. Note
+        # that this also skips any producer side-effects (e.g. inspect).
+        return hi
+    if type(self) is it:
+        self._modified = True
+        return sum(1 for _ in self.items)
+    return sum(1 for _ in self)
 
 
 @trait
@@ -131,10 +156,9 @@ def last(self):
         assert it('abc').skip(1).last() == 'c'
         assert it('abc').cycle().take(8).last() == 'b'
     """
-    item = None
-    for i in self:
-        item = i
-    return item
+    tail = deque(self.items if type(self) is it else self, maxlen=1)
+    self._modified = True
+    return tail[0] if tail else None
 
 
 @trait('max')
@@ -247,7 +271,7 @@ def go(self):
         it('abc').inspect(lambda x: seen.append(x.upper())).go()
         assert seen == ['A', 'B', 'C']
     """
-    for i in self: ...
+    deque(self, maxlen=0)
 
 
 @trait
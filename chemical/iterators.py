@@ -1,8 +1,52 @@
 import math
 from . import it, trait, ChemicalException, NothingToPeek, Ref
+import functools
 import itertools
+from collections import deque
 from collections.abc import Iterable
 
+# Sentinel for "no element buffered" in Peekable/Current. A plain `None`
+# check would misbehave on falsy elements (0, '', False, None).
+_MISSING = object()
+
+# Resolved once so flatten's per-element isinstance check doesn't rebuild
+# the tuple on every call.
+_STR_TYPES = (str, bytes)
+
+# Thread pool shared by every par_iter call, created on first use, and
+# the worker count it was created with (doubles as _pool_map's window).
+_POOL = None
+_POOL_WORKERS = None
+
+def _parallel_pool():
+    global _POOL, _POOL_WORKERS
+    if _POOL is None:
+        import os
+        from concurrent.futures import ThreadPoolExecutor
+        _POOL_WORKERS = os.cpu_count() or 4
+        _POOL = ThreadPoolExecutor(max_workers=_POOL_WORKERS)
+    return _POOL
+
+
+def _identity(x):
+    return x
+
+
+def _pool_map(fn, source):
+    """
+    Like `Executor.map(fn, source)`, but pulls `source` one window of
+    workers at a time instead of submitting every element up front, so
+    infinite upstreams (e.g. `cycle()`) can be consumed lazily.
+    """
+    pool = _parallel_pool()
+    window = _POOL_WORKERS
+    source = iter(source)
+    while True:
+        batch = tuple(itertools.islice(source, window))
+        if not batch:
+            return
+        yield from pool.map(fn, batch)
+
 @trait
 class Skip(it):
     """
@@ -15,20 +59,23 @@ class Skip(it):
         assert it('asdf').skip(1).collect(str) == 'sdf'
         assert it('asdf').rev().skip(1).rev().collect(str) == 'asd'
     """
+    __slots__ = ('times',)
 
     def __init__(self, items, times):
         it.__init__(self, items)
         self.times = times
         assert times > 0, 'skip: number of items to skip must be > 0'
-        self._lower_bound = max(0, self._lower_bound - times)
-        if self._upper_bound:
-            self._upper_bound -= times
+        lo, hi = self._bounds
+        self._bounds = (max(0, lo - times), hi - times if hi else hi)
     
     def __get_next__(self):
-        while self.times > 0:
-            next(self.items)
-            next(self.reverse)
-            self.times -= 1
+        if self.times > 0:
+            # Drain the skipped elements at C speed, keeping the reverse
+            # stream in step with the forward one (see __get_reversed__).
+            deque(itertools.islice(self.items, self.times), maxlen=0)
+            if self.reverse is not None:
+                deque(itertools.islice(self.reverse, self.times), maxlen=0)
+            self.times = 0
 
         return next(self.items)
 
@@ -66,22 +113,25 @@ class Step(it):
         assert it(range(10)).step_by(2).collect() == [0, 2, 4, 6, 8]
         assert it(range(10)).rev().step_by(3).collect() == [9, 6, 3, 0]
     """
+    __slots__ = ('step',)
+
     def __init__(self, items, step):
         it.__init__(self, items)
         self.step = step
 
-        self._lower_bound = max(0, int(math.ceil(self._lower_bound / step)))
-        if self._upper_bound:
-            self._upper_bound = int(math.ceil(self._upper_bound / step))
+        lo, hi = self._bounds
+        self._bounds = (
+            max(0, int(math.ceil(lo / step))),
+            int(math.ceil(hi / step)) if hi else hi
+        )
+
+        # Let islice do the skipping at C level instead of a Python loop
+        # of `next()` calls in __get_next__.
+        if step > 1:
+            self.items = itertools.islice(self.items, 0, None, step)
 
     def __get_next__(self):
-        nxt = next(self.items)
-        try:
-            for _ in range(self.step - 1):
-                next(self.items)
-        except StopIteration:
-            pass
-        return nxt
+        return next(self.items)
 
     def __get_reversed__(self):
         return it(Step(self.reverse, self.step), self.items, self.size_hint())
@@ -92,6 +142,9 @@ def filter_it(self, filter_func):
     """
     Filters out elements of the iterator based on the provided lambda.
 
+    Consecutive filters are fused into a single predicate so that
+    `.filter(p).filter(q)` walks one iterator layer, not two.
+
     **Examples**
 
         :::python
@@ -99,11 +152,20 @@ def filter_it(self, filter_func):
         assert it(range(5)).filter(lambda x: not x % 2).collect() == [0, 2, 4]
         assert it('abcd').filter(lambda x: x in 'bd').collect(str) == 'bd'
     """
-    return it(
-        filter(filter_func, self),
-        None if self.reverse is None else filter(filter_func, self.reverse),
-        (0, self._upper_bound)
+    src = self
+    prev_filter = self._filter_fn
+    if prev_filter is not None and self._map_fn is None:
+        filter_func = lambda x, p=prev_filter, q=filter_func: p(x) and q(x)
+        src = self._fuse_src
+
+    res = it(
+        filter(filter_func, src),
+        lambda: None if src.reverse is None else filter(filter_func, src.reverse),
+        (0, self._bounds[1])
     )
+    res._filter_fn = filter_func
+    res._fuse_src = src
+    return res
 
 
 @trait
@@ -118,10 +180,37 @@ def take(self, num_items):
         assert it(range(5)).take(2).collect() == [0, 1]
         assert it(range(5)).rev().take(3).collect() == [4, 3, 2]
     """
-    return it(
-        itertools.islice(self, num_items), 
-        None if self.reverse is None else itertools.islice(self.reversed, num_items), 
-    [num_items] * 2)
+    lo, hi = self._bounds
+
+    yielded = []
+
+    def forward():
+        for item in itertools.islice(self, num_items):
+            yielded.append(item)
+            yield item
+
+    def reverse_prefix():
+        # take's reverse is the taken *prefix* backwards, which cannot be
+        # derived from the source's reverse stream (that would yield the
+        # last n items). Buffer the prefix — only when rev() is actually
+        # called — and serve both directions from it, so consumers that
+        # advance the two streams in step (e.g. Skip) stay aligned even
+        # when the forward stream has already yielded part of the prefix.
+        done = len(yielded)
+        prefix = tuple(yielded) + tuple(itertools.islice(self, num_items - done))
+        res.items = iter(prefix[done:])
+        return iter(prefix[::-1])
+
+    res = it(
+        forward(),
+        reverse_prefix,
+        (min(lo, num_items), num_items if hi is None else min(hi, num_items))
+    )
+    # An exact source count min-clamped against num_items is still exact.
+    res._exact_size = self._exact_size
+    res._take_n = num_items
+    res._fuse_src = self
+    return res
 
 @trait
 def islice(self, *args):
@@ -141,7 +230,7 @@ def islice(self, *args):
 
     return it(
         itertools.islice(self, *args),
-        None if self.reverse is None else itertools.islice(self.reverse, *args),
+        lambda: None if self.reverse is None else itertools.islice(self.reverse, *args),
         (0, self.size_hint()[1])
     )
 
@@ -159,7 +248,7 @@ def take_while(self, closure):
     
     return it(
         itertools.takewhile(closure, self),
-        None if self.reverse is None else itertools.takewhile(closure, self.reverse),
+        lambda: None if self.reverse is None else itertools.takewhile(closure, self.reverse),
         (0, self.size_hint()[1])
     )
 
@@ -182,10 +271,11 @@ class Peekable(it):
         assert itr.peek() == 'c'
         assert itr.next() == 'c'
     """
+    __slots__ = ('ahead', 'can_peek')
+
     def __init__(self, items):
         it.__init__(self, items)
-        self.ahead = None
-        self.done = False
+        self.ahead = _MISSING
         self.can_peek = True
 
     def has_next(self):
@@ -196,36 +286,21 @@ class Peekable(it):
         return self.can_peek
 
     def peek(self):
-        if self.done:
-            raise NothingToPeek()
-
-        if not self.ahead:
+        ahead = self.ahead
+        if ahead is _MISSING:
             try:
-                self.ahead = next(self.items)
+                ahead = self.ahead = next(self.items)
             except StopIteration as e:
-                #self.done = True
                 raise NothingToPeek().with_traceback(e.__traceback__) from e
 
-        return self.ahead
+        return ahead
 
     def __get_next__(self):
-        if self.done:
-            raise StopIteration()
-
-        try:
-            if not self.ahead:
-                self.ahead = next(self.items)
-        except StopIteration as e:
-            pass
-
-        ret = self.ahead
-        try:
-            self.ahead = next(self.items)
-        except StopIteration:
-            self.done = True
-            return ret
-
-        return ret
+        ahead = self.ahead
+        if ahead is _MISSING:
+            return next(self.items)
+        self.ahead = _MISSING
+        return ahead
 
 
 @trait('chain')
@@ -243,13 +318,13 @@ def chain_it(self, itr):
     chained = it(itr)
     return it(
         itertools.chain(self, chained),
-        None if ((chained.reverse is None) or (self.reverse is None)) else itertools.chain(
+        lambda: None if ((chained.reverse is None) or (self.reverse is None)) else itertools.chain(
             chained.rev() if isinstance(chained, it) else reversed(chained),
             self.rev()
         ),
         (
-            self._lower_bound + chained._lower_bound,
-            self._upper_bound + chained._upper_bound
+            self._bounds[0] + chained._bounds[0],
+            self._bounds[1] + chained._bounds[1]
         )
     )
 
@@ -270,7 +345,7 @@ def cycle_it(self):
     """
     return it(
         itertools.cycle(self), 
-        None if self.reverse is None else itertools.cycle(self.reverse)
+        lambda: None if self.reverse is None else itertools.cycle(self.reverse)
     )
 
 
@@ -279,17 +354,56 @@ def map_it(self, closure):
     """
     Applies a given function to each element and returns the result instead.
 
+    Consecutive maps are fused by composing their functions, and
+    `.filter(p).map(f)` fuses into a single filter-map pass, so each
+    element only crosses one iterator layer regardless of chain length.
+
     **Examples**
 
         :::python
 
         assert it('abc').map(lambda x: x.upper()).collect(str) == 'ABC'
     """
-    return it(
-        map(closure, self),
-        None if self.reverse is None else map(closure, self.reverse),
+    src = self
+    prev_map = self._map_fn
+    prev_filter = self._filter_fn
+
+    if prev_filter is not None and prev_map is None:
+        return _filter_map(self, prev_filter, closure)
+
+    if prev_map is not None and prev_filter is None:
+        closure = lambda x, f=prev_map, g=closure: g(f(x))
+        src = self._fuse_src
+
+    res = it(
+        map(closure, src),
+        lambda: None if src.reverse is None else map(closure, src.reverse),
         self.size_hint()
     )
+    res._exact_size = self._exact_size
+    res._map_fn = closure
+    res._fuse_src = src
+    return res
+
+
+def _filter_map(self, filter_func, closure):
+    """
+    Fused `.filter(p).map(f)` combinator: a single pass that tests each
+    element with `p` and yields `f(element)` for the ones that survive.
+    """
+    src = self._fuse_src
+
+    res = it(
+        (closure(x) for x in src if filter_func(x)),
+        lambda: None if src.reverse is None else (
+            closure(x) for x in src.reverse if filter_func(x)
+        ),
+        self.size_hint()
+    )
+    res._filter_fn = filter_func
+    res._map_fn = closure
+    res._fuse_src = src
+    return res
 
 @trait
 def starmap(self, closure):
@@ -302,7 +416,11 @@ def starmap(self, closure):
 
         assert it([[1,2],[3,4],[5,6]]).starmap(operator.mul).collect() == [2, 12, 30]
     """
-    return self.map(lambda args: closure(*args))
+    return it(
+        itertools.starmap(closure, self),
+        lambda: None if self.reverse is None else itertools.starmap(closure, self.reverse),
+        self.size_hint()
+    )
 
 @trait('enumerate')
 def enumerate_it(self):
@@ -315,7 +433,11 @@ def enumerate_it(self):
 
         assert it((1, 2, 3)).enumerate().collect() == [(0, 1), (1, 2), (2, 3)]
     """
-    return it(enumerate(self), None if self.reverse is None else enumerate(self.reverse), self.size_hint())
+    return it(
+        enumerate(self),
+        lambda: None if self.reverse is None else enumerate(self.reverse),
+        self.size_hint()
+    )
 
 
 @trait
@@ -340,6 +462,8 @@ class Inspect(it):
             .go()
         )
     """
+    __slots__ = ('func',)
+
     def __init__(self, items, func):
         it.__init__(self, items)
         self.func = func
@@ -370,12 +494,25 @@ def zip_it(self, other):
         assert it(range(2)).zip(range(1000)).collect() == [(0, 0), (1, 1)]
     """
     other_it = it(other)
+
+    # Pair the raw underlying iterators so the C-level zip is not
+    # re-entering a Python __next__ on either side. Bypassing the wrapper
+    # skips the bookkeeping in it.__next__, so flag the consumption up
+    # front the same way collect's fast path does.
+    if type(self) is it:
+        self._modified = True
+        left = self.items
+    else:
+        left = self
+    other_it._modified = True
+
     return it(
-        zip(self, other_it),
-        None if self.reverse is None else zip(self.reverse, reversed(other_it)),
+        zip(left, other_it.items),
+        lambda: None if (self.reverse is None or other_it.reverse is None)
+                else zip(self.reverse, other_it.reverse),
         (
-            self._lower_bound + other_it._lower_bound,
-            self._upper_bound + other_it._upper_bound
+            self._bounds[0] + other_it._bounds[0],
+            self._bounds[1] + other_it._bounds[1]
         )
     )
 
@@ -396,8 +533,8 @@ def skip_while(self, closure):
     """
     return it(
         itertools.dropwhile(closure, self), 
-        None if self.reverse is None else itertools.dropwhile(closure, self.reverse), 
-        (0, self._upper_bound)
+        lambda: None if self.reverse is None else itertools.dropwhile(closure, self.reverse), 
+        (0, self._bounds[1])
     )
 
 
@@ -417,15 +554,24 @@ def flatten(self, preserve_strings=True, max_depth=1):
         assert it([[[[[1]],[2]],[3]],[4]]).flatten(max_depth=None).collect()==[1,2,3,4]
     """
     if max_depth is None: max_depth = math.inf
-    def deepflatten_generic(xs, depth=0):
-        for x in xs:
-            if isinstance(x, Iterable) and (preserve_strings or not isinstance(x, (str, bytes))) and (depth<max_depth):
-                yield from deepflatten_generic(x, depth=depth+1)
+    def flat(xs):
+        # One generator frame total: nested iterables are pushed onto an
+        # explicit stack rather than recursed into with `yield from`,
+        # which would cost one frame per nesting level per element.
+        stack = [(iter(xs), 0)]
+        while stack:
+            itr, depth = stack[-1]
+            for x in itr:
+                if depth < max_depth and isinstance(x, Iterable) and (preserve_strings or not isinstance(x, _STR_TYPES)):
+                    stack.append((iter(x), depth + 1))
+                    break
+                else:
+                    yield x
             else:
-                yield x
+                stack.pop()
     return it(
-        deepflatten_generic(self),
-        deepflatten_generic(self.reverse),
+        flat(self),
+        lambda: None if self.reverse is None else flat(self.reverse),
         (self.size_hint()[0], None)
     )
 
@@ -444,7 +590,7 @@ def for_each(self, closure):
     """
     return it(
         (closure(i) for i in self),
-        (closure(i) for i in self.reverse),
+        lambda: None if self.reverse is None else (closure(i) for i in self.reverse),
         self.size_hint()
     )
 
@@ -476,8 +622,7 @@ def fold(self, seed, closure):
 
         assert it((1, 2, 3)).fold(1, lambda a, b: a*b) == 6
     """
-    for i in self: seed = closure(seed, i)
-    return seed
+    return functools.reduce(closure, self, seed)
 
 
 @trait
@@ -506,7 +651,126 @@ def scan(self, seed, closure):
 
     return it(
         itertools.accumulate(self, closure, initial=seed),
-        None if self.reverse is None else itertools.accumulate(self.reverse, closure, initial=seed),
+        lambda: None if self.reverse is None else itertools.accumulate(self.reverse, closure, initial=seed),
+        self.size_hint()
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_pipeline(shape):
+    """
+    Generates (and caches, keyed on the stage-type tuple) a single
+    generator function equivalent to a chain of map/filter/take stages.
+    """
+    args, setup, body, after = [], [], [], []
+    for i, stage in enumerate(shape):
+        if stage == 'map':
+            args.append(f'_f{i}')
+            body.append(f'x = _f{i}(x)')
+        elif stage == 'filter':
+            args.append(f'_p{i}')
+            body.append(f'if not _p{i}(x): continue')
+        elif stage == 'filtermap':
+            args += [f'_p{i}', f'_f{i}']
+            body.append(f'if not _p{i}(x): continue')
+            body.append(f'x = _f{i}(x)')
+        elif stage == 'take':
+            args.append(f'_n{i}')
+            setup.append(f'_c{i} = 0')
+            body.append(f'if _c{i} >= _n{i}: return')
+            body.append(f'_c{i} += 1')
+            # Return right after the nth yield, like islice, instead of
+            # pulling one more source element on the next resumption.
+            after.append(f'if _c{i} >= _n{i}: return')
+
+    source = f'def _pipeline(_src, {", ".join(args)}):\n'
+    for line in setup:
+        source += f'    {line}\n'
+    source += '    for x in _src:\n'
+    for line in body:
+        source += f'        {line}\n'
+    source += '        yield x\n'
+    for line in after:
+        source += f'        {line}\n'
+
+    namespace = {}
+    exec(source, namespace)
+    return namespace['_pipeline']
+
+
+@trait
+def compile(self):
+    """
+    Collapses a chain of `map`/`filter`/`take` stages into one generated
+    generator function, so each element crosses a single Python frame no
+    matter how long the chain is.
+
+    The generated function is compiled once per pipeline *shape* and
+    reused, so repeatedly compiling structurally identical pipelines is
+    cheap. Pipelines containing stages that cannot be recompiled (or
+    that have already been partially consumed) are returned unchanged.
+
+    **Examples**
+
+        :::python
+
+        assert (it(range(10))
+            .map(lambda x: x * 2)
+            .filter(lambda x: x > 5)
+            .take(3)
+            .compile()
+            .collect()
+        ) == [6, 8, 10]
+    """
+    stages = []
+    cur = self
+    # Checking each stage's own _modified flag matters: a partially
+    # consumed intermediate (e.g. a take the caller advanced) must not be
+    # recompiled with its counter reset to zero.
+    while type(cur) is it and not cur._modified:
+        if cur._filter_fn is not None and cur._map_fn is not None:
+            stages.append(('filtermap', cur._filter_fn, cur._map_fn))
+        elif cur._map_fn is not None:
+            stages.append(('map', cur._map_fn))
+        elif cur._filter_fn is not None:
+            stages.append(('filter', cur._filter_fn))
+        elif cur._take_n is not None:
+            stages.append(('take', cur._take_n))
+        else:
+            break
+        cur = cur._fuse_src
+
+    if not stages:
+        return self
+
+    stages.reverse()
+    fn = _compile_pipeline(tuple(stage[0] for stage in stages))
+    args = [arg for stage in stages for arg in stage[1:]]
+
+    if any(stage[0] == 'take' for stage in stages):
+        # A take stage's reverse is its yielded prefix backwards (see
+        # take), which running the pipeline over cur.reverse cannot
+        # reproduce. Reuse take's buffering scheme on the compiled output.
+        gen = fn(cur, *args)
+        yielded = []
+
+        def forward():
+            for item in gen:
+                yielded.append(item)
+                yield item
+
+        def reverse_prefix():
+            done = len(yielded)
+            prefix = tuple(yielded) + tuple(gen)
+            res.items = iter(prefix[done:])
+            return iter(prefix[::-1])
+
+        res = it(forward(), reverse_prefix, self.size_hint())
+        return res
+
+    return it(
+        fn(cur, *args),
+        lambda: None if cur.reverse is None else fn(cur.reverse, *args),
         self.size_hint()
     )
 
@@ -560,42 +824,23 @@ def par_iter(self):
         )
     """
 
-    def _process_items(the_items):
-        yield
-
-        from concurrent.futures import ThreadPoolExecutor, as_completed, Future
-        import multiprocessing
-
-        num_cores = multiprocessing.cpu_count()
+    # When the upstream stage is a fused `.map(f)`, hand `f` itself to the
+    # pool so the mapped work is what runs concurrently — this is the
+    # documented HTTP use case. Otherwise fall back to an identity job per
+    # element, which still preserves order. The upstream is fed to the
+    # pool one window of workers at a time (see _pool_map) so that only a
+    # bounded number of elements is ever pulled or in flight at once.
+    fn = self._map_fn
+    if fn is not None and self._filter_fn is None:
+        src = self._fuse_src
+    else:
+        fn, src = _identity, self
 
-        pool = ThreadPoolExecutor(max_workers=num_cores)
-        submitted = [None] * num_cores
-        completed = False
-
-        while not completed:
-            for i in range(num_cores):
-                submitted[i] = pool.submit(
-                    lambda s, idx: (idx, next(s)), the_items, i
-                )
-
-            for value in as_completed(submitted):
-                try:
-                    index, val = value.result()
-                    submitted[index] = val
-                except StopIteration:
-                    completed = True
-
-            for value in submitted:
-                if not isinstance(value, Future):
-                    yield value
-
-
-    # Prevent from continuing right off the bat by returning None initially.
-    # E.g. subsequent calls to next() will yield actual values.
-    forward = next(_process_items(self.items))
-    backward = None if self.reversed is None else next(_process_items(self.rev()))
-
-    return it(forward, backward, self.size_hint())
+    return it(
+        _pool_map(fn, src),
+        lambda: None if src.reverse is None else _pool_map(fn, src.reverse),
+        self.size_hint()
+    )
 
 
 @trait
@@ -622,6 +867,8 @@ class Current(Peekable):
         assert c.peek() == 's'
         assert c.next() == 's'
     """
+    __slots__ = ('current_item',)
+
     def __init__(self, items):
         Peekable.__init__(self, items)
         self.current_item = None
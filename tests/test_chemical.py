@@ -182,6 +182,10 @@ def test_filter():
     func = lambda x: x > 2; data = 1, 2, 3, 4, 5
     assert it(data).filter(func).collect() == list(filter(func, data))
 
+    # Falsy elements must pass through untouched when the predicate accepts
+    # them; filtering must never halt on 0, '', None, or False.
+    assert it([1, 0, 2, 0, 3]).filter(lambda x: True).collect() == [1, 0, 2, 0, 3]
+
     assert it(data).filter(func).rev().collect() == [5, 4, 3]
     assert it(data).filter(func).take(3).rev().collect() == [5, 4, 3]
 
@@ -629,6 +633,30 @@ def test_flatten():
     assert it('abc').zip('123').flatten().rev().size_hint() == (6, 6)
 
 
+def test_compile():
+    assert (it(range(10))
+        .map(lambda x: x * 2)
+        .filter(lambda x: x > 5)
+        .take(3)
+        .compile()
+        .collect()
+    ) == [6, 8, 10]
+
+    assert it(range(5)).compile().collect() == [0, 1, 2, 3, 4]
+    assert (it(range(10))
+        .filter(lambda x: x % 2)
+        .map(lambda x: x + 1)
+        .compile()
+        .collect()
+    ) == [2, 4, 6, 8, 10]
+
+    assert it((1, 2, 3)).map(lambda x: x ** x).compile().rev().collect() == [
+        27, 4, 1
+    ]
+
+    assert it('abc').map(lambda x: x.upper()).compile().size_hint() == (3, 3)
+
+
 def test_intermittent_usage():
     a = it('asdf')
     assert a.next() == 'a'